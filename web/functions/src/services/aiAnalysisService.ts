@@ -20,6 +20,23 @@ import type {
 // Uses .env file during deployment, avoiding Secret Manager permission issues
 export const openaiApiKey = defineString('OPENAI_API_KEY');
 
+// Reused across invocations on a warm instance so HTTP connections stay pooled
+let openaiClient: OpenAI | null = null;
+
+/**
+ * Get the shared OpenAI client, creating it on first use
+ */
+function getOpenAIClient(): OpenAI {
+  if (!openaiClient) {
+    const apiKey = openaiApiKey.value();
+    if (!apiKey) {
+      throw new Error('OPENAI_API_KEY secret is not configured');
+    }
+    openaiClient = new OpenAI({ apiKey });
+  }
+  return openaiClient;
+}
+
 /**
  * System prompt for GPT-4o to extract InDriver ride data
  */
@@ -146,12 +163,7 @@ export async function extractRideData(
   ocrText: string,
   sourceImagePath: string
 ): Promise<ExtractedInDriverRide> {
-  const apiKey = openaiApiKey.value();
-  if (!apiKey) {
-    throw new Error('OPENAI_API_KEY secret is not configured');
-  }
-
-  const openai = new OpenAI({ apiKey });
+  const openai = getOpenAIClient();
 
   functions.logger.info(`[AIAnalysis] Starting extraction for ${sourceImagePath}`);
   functions.logger.debug(`[AIAnalysis] OCR text length: ${ocrText.length} chars`);
@@ -39,6 +39,23 @@ import {
   formatPeriodDisplaySpanish,
 } from '../utils/period.utils';
 
+// Reused across invocations on a warm instance so HTTP connections stay pooled
+let anthropicClient: Anthropic | null = null;
+
+/**
+ * Get the shared Anthropic client, creating it on first use
+ */
+function getAnthropicClient(): Anthropic {
+  if (!anthropicClient) {
+    const apiKey = anthropicApiKey.value();
+    if (!apiKey) {
+      throw new Error('ANTHROPIC_API_KEY is not configured');
+    }
+    anthropicClient = new Anthropic({ apiKey });
+  }
+  return anthropicClient;
+}
+
 // ============ Query Functions ============
 
 /**
@@ -580,12 +597,7 @@ export async function generateAIInsights(
   metrics: InsightsMetrics,
   periodRange: PeriodRange
 ): Promise<Insight[]> {
-  const apiKey = anthropicApiKey.value();
-  if (!apiKey) {
-    throw new Error('ANTHROPIC_API_KEY is not configured');
-  }
-
-  const anthropic = new Anthropic({ apiKey });
+  const anthropic = getAnthropicClient();
 
   functions.logger.info(`[Insights] Generating AI insights for ${periodRange.id}`);
 